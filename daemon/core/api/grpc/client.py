@@ -1207,10 +1207,13 @@ class CoreGrpcClient:
 
     def connect(self) -> None:
         """
-        Open connection to server, must be closed manually.
+        Open connection to server, must be closed manually. An already opened
+        channel is reused, rather than creating a new connection.
 
         :return: nothing
         """
+        if self.channel:
+            return
         self.channel = grpc.insecure_channel(
             self.address, options=[("grpc.enable_http_proxy", self.proxy)]
         )
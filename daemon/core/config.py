@@ -3,7 +3,6 @@ Common support for configurable CORE objects.
 """
 
 import logging
-from collections import OrderedDict
 from typing import TYPE_CHECKING, Dict, List, Tuple, Type, Union
 
 from core.emane.nodes import EmaneNet
@@ -21,6 +20,8 @@ class ConfigGroup:
     Defines configuration group tabs used for display by ConfigurationOptions.
     """
 
+    __slots__ = ("name", "start", "stop")
+
     def __init__(self, name: str, start: int, stop: int) -> None:
         """
         Creates a ConfigGroup object.
@@ -39,6 +40,8 @@ class Configuration:
     Represents a configuration options.
     """
 
+    __slots__ = ("id", "type", "default", "options", "label")
+
     def __init__(
         self,
         _id: str,
@@ -100,13 +103,17 @@ class ConfigurableOptions:
     @classmethod
     def default_values(cls) -> Dict[str, str]:
         """
-        Provides an ordered mapping of configuration keys to default values.
+        Provides an ordered mapping of configuration keys to default values. The
+        mapping is built once per class, classes that change their configurations
+        at runtime need to reset _default_values to None.
 
         :return: ordered configuration mapping default values
         """
-        return OrderedDict(
-            [(config.id, config.default) for config in cls.configurations()]
-        )
+        default_values = cls.__dict__.get("_default_values")
+        if default_values is None:
+            default_values = {x.id: x.default for x in cls.configurations()}
+            cls._default_values = default_values
+        return dict(default_values)
 
 
 class ConfigurableManager:
@@ -139,7 +146,7 @@ class ConfigurableManager:
         :param node_id: node id to clear configurations for, default is None and clears all configurations
         :return: nothing
         """
-        if not node_id:
+        if node_id is None:
             self.node_configurations.clear()
         elif node_id in self.node_configurations:
             self.node_configurations.pop(node_id)
@@ -160,8 +167,8 @@ class ConfigurableManager:
         :param config_type: configuration type to store configuration for
         :return: nothing
         """
-        node_configs = self.node_configurations.setdefault(node_id, OrderedDict())
-        node_type_configs = node_configs.setdefault(config_type, OrderedDict())
+        node_configs = self.node_configurations.setdefault(node_id, {})
+        node_type_configs = node_configs.setdefault(config_type, {})
         node_type_configs[_id] = value
 
     def set_configs(
@@ -181,7 +188,7 @@ class ConfigurableManager:
         logging.debug(
             "setting config for node(%s) type(%s): %s", node_id, config_type, config
         )
-        node_configs = self.node_configurations.setdefault(node_id, OrderedDict())
+        node_configs = self.node_configurations.setdefault(node_id, {})
         node_configs[config_type] = config
 
     def get_config(
@@ -200,11 +207,13 @@ class ConfigurableManager:
         :param default: default value to return when value is not found
         :return: configuration value
         """
-        result = default
-        node_type_configs = self.get_configs(node_id, config_type)
-        if node_type_configs:
-            result = node_type_configs.get(_id, default)
-        return result
+        node_configs = self.node_configurations.get(node_id)
+        if not node_configs:
+            return default
+        node_type_configs = node_configs.get(config_type)
+        if not node_type_configs:
+            return default
+        return node_type_configs.get(_id, default)
 
     def get_configs(
         self, node_id: int = _default_node, config_type: str = _default_type
@@ -247,14 +256,14 @@ class ModelManager(ConfigurableManager):
 
     def set_model_config(
         self, node_id: int, model_name: str, config: Dict[str, str] = None
-    ) -> None:
+    ) -> Dict[str, str]:
         """
         Set configuration data for a model.
 
         :param node_id: node id to set model configuration for
         :param model_name: model to set configuration for
         :param config: configuration data to set for model
-        :return: nothing
+        :return: resulting model configuration for node
         """
         # get model class to configure
         model_class = self.models.get(model_name)
@@ -263,17 +272,15 @@ class ModelManager(ConfigurableManager):
 
         # retrieve default values
         model_config = self.get_model_config(node_id, model_name)
-        if not config:
-            config = {}
-        for key in config:
-            value = config[key]
-            model_config[key] = value
+        if config:
+            model_config.update(config)
 
         # set as node model for startup
         self.node_models[node_id] = model_name
 
         # set configuration
         self.set_configs(model_config, node_id=node_id, config_type=model_name)
+        return model_config
 
     def get_model_config(self, node_id: int, model_name: str) -> Dict[str, str]:
         """
@@ -313,8 +320,7 @@ class ModelManager(ConfigurableManager):
         logging.debug(
             "setting model(%s) for node(%s): %s", model_class.name, node.id, config
         )
-        self.set_model_config(node.id, model_class.name, config)
-        config = self.get_model_config(node.id, model_class.name)
+        config = self.set_model_config(node.id, model_class.name, config)
         node.setmodel(model_class, config)
 
     def get_models(
@@ -329,15 +335,14 @@ class ModelManager(ConfigurableManager):
         """
         all_configs = self.get_all_configs(node.id)
         if not all_configs:
-            all_configs = {}
-
-        models = []
-        for model_name in all_configs:
-            config = all_configs[model_name]
-            if model_name == ModelManager._default_node:
-                continue
-            model_class = self.models[model_name]
-            models.append((model_class, config))
+            return []
+
+        # configurations stored without a config type are not model configurations
+        models = [
+            (self.models[model_name], config)
+            for model_name, config in all_configs.items()
+            if model_name != self._default_type
+        ]
 
         logging.debug("models for node(%s): %s", node.id, models)
         return models
@@ -50,6 +50,7 @@ class EmaneCommEffectModel(emanemodel.EmaneModel):
     def load(cls, emane_prefix: str) -> None:
         shim_xml_path = os.path.join(emane_prefix, "share/emane/manifest", cls.shim_xml)
         cls.config_shim = emanemanifest.parse(shim_xml_path, cls.shim_defaults)
+        cls._default_values = None
 
     @classmethod
     def configurations(cls) -> List[Configuration]:
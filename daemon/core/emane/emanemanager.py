@@ -382,8 +382,7 @@ class EmaneManager(ModelManager):
                     emane_node.name,
                 )
                 emane_node.model.post_startup()
-                for netif in emane_node.netifs():
-                    netif.setposition()
+                emane_node.setnempositions(emane_node.netifs())
 
     def reset(self) -> None:
         """
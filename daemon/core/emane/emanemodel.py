@@ -63,6 +63,7 @@ class EmaneModel(WirelessModel):
         # load phy configuration
         phy_xml_path = os.path.join(emane_prefix, manifest_path, cls.phy_xml)
         cls.phy_config = emanemanifest.parse(phy_xml_path, cls.phy_defaults)
+        cls._default_values = None
 
     @classmethod
     def configurations(cls) -> List[Configuration]:
@@ -4,7 +4,8 @@ share the same MAC+PHY model.
 """
 
 import logging
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, List, Optional, Type
 
 from core.emulator.distributed import DistributedServer
 from core.emulator.enumerations import LinkTypes, NodeTypes, RegisterTlvs
@@ -23,8 +24,11 @@ except ImportError:
     try:
         from emanesh.events import LocationEvent
     except ImportError:
+        LocationEvent = None
         logging.debug("compatible emane python bindings not installed")
 
+NODE_ID = attrgetter("node.id")
+
 
 class EmaneNet(CoreNetworkBase):
     """
@@ -50,6 +54,8 @@ class EmaneNet(CoreNetworkBase):
         self.conf = ""
         self.up = False
         self.nemidmap = {}
+        self.nemnetifmap = {}
+        self.sorted_netifs = None
         self.model = None
         self.mobility = None
 
@@ -84,6 +90,14 @@ class EmaneNet(CoreNetworkBase):
     def shutdown(self) -> None:
         pass
 
+    def attach(self, netif: CoreInterface) -> None:
+        super().attach(netif)
+        self.sorted_netifs = None
+
+    def detach(self, netif: CoreInterface) -> None:
+        super().detach(netif)
+        self.sorted_netifs = None
+
     def link(self, netif1: CoreInterface, netif2: CoreInterface) -> None:
         pass
 
@@ -117,7 +131,11 @@ class EmaneNet(CoreNetworkBase):
         Record an interface to numerical ID mapping. The Emane controller
         object manages and assigns these IDs for all NEMs.
         """
+        old_nemid = self.nemidmap.get(netif)
+        if old_nemid is not None and self.nemnetifmap.get(old_nemid) is netif:
+            self.nemnetifmap.pop(old_nemid)
         self.nemidmap[netif] = nemid
+        self.nemnetifmap[nemid] = netif
 
     def getnemid(self, netif: CoreInterface) -> Optional[int]:
         """
@@ -133,16 +151,17 @@ class EmaneNet(CoreNetworkBase):
         Given a numerical NEM ID, return its interface. This returns the
         first interface that matches the given NEM ID.
         """
-        for netif in self.nemidmap:
-            if self.nemidmap[netif] == nemid:
-                return netif
-        return None
+        return self.nemnetifmap.get(nemid)
 
     def netifs(self, sort: bool = True) -> List[CoreInterface]:
         """
-        Retrieve list of linked interfaces sorted by node number.
+        Retrieve list of linked interfaces sorted by node number. Interfaces are
+        always sorted, sort is only kept for compatibility with the base class.
         """
-        return sorted(self._netif.values(), key=lambda ifc: ifc.node.id)
+        # cleared by attach and detach, the only writers of _netif for networks
+        if self.sorted_netifs is None:
+            self.sorted_netifs = sorted(self._netif.values(), key=NODE_ID)
+        return list(self.sorted_netifs)
 
     def installnetifs(self) -> None:
         """
@@ -150,29 +169,30 @@ class EmaneNet(CoreNetworkBase):
         EMANE daemons have been started, because that is their only chance
         to bind to the TAPs.
         """
-        if (
-            self.session.emane.genlocationevents()
-            and self.session.emane.service is None
-        ):
+        genlocationevents = self.session.emane.genlocationevents()
+        if genlocationevents and self.session.emane.service is None:
             warntxt = "unable to publish EMANE events because the eventservice "
             warntxt += "Python bindings failed to load"
             logging.error(warntxt)
 
+        external = self.session.emane.get_config("external", self.id, self.model.name)
+        moved_netifs = []
         for netif in self.netifs():
-            external = self.session.emane.get_config(
-                "external", self.id, self.model.name
-            )
             if external == "0":
                 netif.setaddrs()
 
-            if not self.session.emane.genlocationevents():
+            if not genlocationevents:
                 netif.poshook = None
                 continue
 
             # at this point we register location handlers for generating
             # EMANE location events
             netif.poshook = self.setnemposition
-            netif.setposition()
+            moved_netifs.append(netif)
+
+        # publish initial positions for all interfaces within a single event
+        if moved_netifs:
+            self.setnempositions(moved_netifs)
 
     def deinstallnetifs(self) -> None:
         """
@@ -185,45 +205,13 @@ class EmaneNet(CoreNetworkBase):
                 netif.shutdown()
             netif.poshook = None
 
-    def _nem_position(
-        self, netif: CoreInterface
-    ) -> Optional[Tuple[int, float, float, float]]:
-        """
-        Creates nem position for emane event for a given interface.
-
-        :param netif: interface to get nem emane position for
-        :return: nem position tuple, None otherwise
-        """
-        nemid = self.getnemid(netif)
-        ifname = netif.localname
-        if nemid is None:
-            logging.info("nemid for %s is unknown", ifname)
-            return
-        node = netif.node
-        x, y, z = node.getposition()
-        lat, lon, alt = self.session.location.getgeo(x, y, z)
-        if node.position.alt is not None:
-            alt = node.position.alt
-        # altitude must be an integer or warning is printed
-        alt = int(round(alt))
-        return nemid, lon, lat, alt
-
     def setnemposition(self, netif: CoreInterface) -> None:
         """
         Publish a NEM location change event using the EMANE event service.
 
         :param netif: interface to set nem position for
         """
-        if self.session.emane.service is None:
-            logging.info("position service not available")
-            return
-
-        position = self._nem_position(netif)
-        if position:
-            nemid, lon, lat, alt = position
-            event = LocationEvent()
-            event.append(nemid, latitude=lat, longitude=lon, altitude=alt)
-            self.session.emane.service.publish(0, event)
+        self.setnempositions([netif])
 
     def setnempositions(self, moved_netifs: List[CoreInterface]) -> None:
         """
@@ -238,10 +226,28 @@ class EmaneNet(CoreNetworkBase):
             logging.info("position service not available")
             return
 
-        event = LocationEvent()
+        if LocationEvent is None:
+            logging.error("emane location events require the emane python bindings")
+            return
+
+        nems = []
         for netif in moved_netifs:
-            position = self._nem_position(netif)
-            if position:
-                nemid, lon, lat, alt = position
-                event.append(nemid, latitude=lat, longitude=lon, altitude=alt)
+            nemid = self.getnemid(netif)
+            if nemid is None:
+                logging.info("nemid for %s is unknown", netif.localname)
+                continue
+            nems.append((nemid, netif.node))
+        if not nems:
+            return
+
+        # convert all positions with a single call
+        positions = [node.getposition() for _, node in nems]
+        geos = self.session.location.getgeos(positions)
+        event = LocationEvent()
+        for (nemid, node), (lat, lon, alt) in zip(nems, geos):
+            if node.position.alt is not None:
+                alt = node.position.alt
+            # altitude must be an integer or warning is printed
+            alt = int(round(alt))
+            event.append(nemid, latitude=lat, longitude=lon, altitude=alt)
         self.session.emane.service.publish(0, event)
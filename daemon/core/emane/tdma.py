@@ -42,6 +42,7 @@ class EmaneTdmaModel(emanemodel.EmaneModel):
                 label="TDMA schedule file (core)",
             ),
         )
+        cls._default_values = None
 
     def post_startup(self) -> None:
         """
@@ -117,5 +117,10 @@ class Application(tk.Frame):
         else:
             self.toolbar.set_design()
 
+    def quit(self):
+        self.core.close()
+        super().quit()
+
     def close(self):
+        self.core.close()
         self.master.destroy()
@@ -6,7 +6,7 @@ import logging
 import os
 from pathlib import Path
 from tkinter import messagebox
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Callable, Dict, List
 
 import grpc
 
@@ -116,7 +116,7 @@ class CoreClient:
                 self.cancel_events()
                 self._client.create_session(self.session_id)
                 self.handling_events = self._client.events(
-                    self.session_id, self.handle_events
+                    self.session_id, self.tk_handler(self.handle_events)
                 )
                 if throughputs_enabled:
                     self.enable_throughputs()
@@ -166,6 +166,13 @@ class CoreClient:
             observer = Observer(config["name"], config["cmd"])
             self.custom_observers[observer.name] = observer
 
+    def tk_handler(self, handler: Callable) -> Callable:
+        """
+        Wraps a grpc stream handler, so streamed events are handled within the tk
+        event loop rather than the stream thread.
+        """
+        return lambda event: self.app.after(0, handler, event)
+
     def handle_events(self, event: core_pb2.Event):
         if event.session_id != self.session_id:
             logging.warning(
@@ -229,7 +236,7 @@ class CoreClient:
 
     def enable_throughputs(self):
         self.handling_throughputs = self.client.throughputs(
-            self.session_id, self.handle_throughputs
+            self.session_id, self.tk_handler(self.handle_throughputs)
         )
 
     def cancel_throughputs(self):
@@ -272,7 +279,7 @@ class CoreClient:
             session = response.session
             self.state = session.state
             self.handling_events = self.client.events(
-                self.session_id, self.handle_events
+                self.session_id, self.tk_handler(self.handle_events)
             )
 
             # get location
@@ -413,8 +420,16 @@ class CoreClient:
                 except ValueError:
                     logging.exception("unknown shape: %s", shape_type)
 
+        tag_raise = self.app.canvas.tag_raise
         for tag in tags.ABOVE_WALLPAPER_TAGS:
-            self.app.canvas.tag_raise(tag)
+            tag_raise(tag)
+
+    def get_sessions(self) -> core_pb2.GetSessionsResponse:
+        """
+        Query sessions directly from the connected channel, avoiding the current
+        session check done when using the client property.
+        """
+        return self._client.get_sessions()
 
     def create_new_session(self):
         """
@@ -472,7 +487,7 @@ class CoreClient:
                 group_services.add(service.name)
 
             # if there are no sessions, create a new session, else join a session
-            response = self.client.get_sessions()
+            response = self.get_sessions()
             sessions = response.sessions
             if len(sessions) == 0:
                 self.create_new_session()
@@ -768,7 +783,9 @@ class CoreClient:
         Clean ups when done using grpc
         """
         logging.debug("close grpc")
-        self.client.close()
+        self.cancel_throughputs()
+        self.cancel_events()
+        self._client.close()
 
     def next_node_id(self) -> int:
         """
@@ -4,13 +4,16 @@ set wallpaper
 import logging
 import tkinter as tk
 from tkinter import ttk
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from PIL import Image, ImageTk
 
 from core.gui.appconfig import BACKGROUNDS_PATH
 from core.gui.dialogs.dialog import Dialog
 from core.gui.images import Images
+from core.gui.task import BackgroundTask
 from core.gui.themes import PADX, PADY
-from core.gui.widgets import image_chooser
+from core.gui.widgets import configure_columns, image_chooser
 
 if TYPE_CHECKING:
     from core.gui.app import Application
@@ -28,6 +31,7 @@ class CanvasWallpaperDialog(Dialog):
         self.adjust_to_dim = tk.BooleanVar(value=self.canvas.adjust_to_dim.get())
         self.filename = tk.StringVar(value=self.canvas.wallpaper_file)
         self.image_label = None
+        self.preview_id = 0
         self.options = []
         self.draw()
 
@@ -55,9 +59,7 @@ class CanvasWallpaperDialog(Dialog):
 
     def draw_image_selection(self):
         frame = ttk.Frame(self.top)
-        frame.columnconfigure(0, weight=2)
-        frame.columnconfigure(1, weight=1)
-        frame.columnconfigure(2, weight=1)
+        configure_columns(frame, (2, 1, 1))
         frame.grid(sticky="ew")
 
         entry = ttk.Entry(frame, textvariable=self.filename)
@@ -72,10 +74,7 @@ class CanvasWallpaperDialog(Dialog):
 
     def draw_options(self):
         frame = ttk.Frame(self.top)
-        frame.columnconfigure(0, weight=1)
-        frame.columnconfigure(1, weight=1)
-        frame.columnconfigure(2, weight=1)
-        frame.columnconfigure(3, weight=1)
+        configure_columns(frame, (1, 1, 1, 1))
         frame.grid(sticky="ew")
 
         button = ttk.Radiobutton(
@@ -119,8 +118,7 @@ class CanvasWallpaperDialog(Dialog):
     def draw_buttons(self):
         frame = ttk.Frame(self.top)
         frame.grid(pady=PADY, sticky="ew")
-        frame.columnconfigure(0, weight=1)
-        frame.columnconfigure(1, weight=1)
+        configure_columns(frame, (1, 1))
 
         button = ttk.Button(frame, text="Apply", command=self.click_apply)
         button.grid(row=0, column=0, sticky="ew", padx=PADX)
@@ -135,7 +133,38 @@ class CanvasWallpaperDialog(Dialog):
             self.draw_preview()
 
     def draw_preview(self):
-        image = Images.create(self.filename.get(), 250, 135)
+        # newer previews invalidate any preview still loading
+        self.preview_id += 1
+        self.clear_preview("(loading preview)")
+        task = BackgroundTask(
+            self.app,
+            self.load_preview,
+            self.set_preview,
+            (self.preview_id, self.filename.get()),
+        )
+        task.start()
+
+    def load_preview(
+        self, preview_id: int, filename: str
+    ) -> Tuple[int, Optional[Image.Image]]:
+        """
+        Decode and resize preview image, ran from a background task.
+        """
+        try:
+            image = Images.load(filename, 250, 135)
+        except (OSError, ValueError):
+            logging.error("invalid background: %s", filename)
+            image = None
+        return preview_id, image
+
+    def set_preview(self, preview_id: int, image: Optional[Image.Image]):
+        if preview_id != self.preview_id or not self.winfo_exists():
+            return
+        if image is None:
+            self.image_label.config(text="(invalid image)")
+            return
+        self.clear_preview()
+        image = ImageTk.PhotoImage(image)
         self.image_label.config(image=image)
         self.image_label.image = image
 
@@ -145,8 +174,16 @@ class CanvasWallpaperDialog(Dialog):
         """
         # delete entry
         self.filename.set("")
-        # delete display image
-        self.image_label.config(image="", width=32)
+        # delete display image, ignoring any preview still loading
+        self.preview_id += 1
+        self.clear_preview("(image preview)")
+
+    def clear_preview(self, text: str = ""):
+        """
+        Detach the preview image from the label and drop our reference, so tk
+        frees the image instead of holding it until the next preview.
+        """
+        self.image_label.config(image="", text=text)
         self.image_label.image = None
 
     def click_adjust_canvas(self):
@@ -168,12 +205,33 @@ class CanvasWallpaperDialog(Dialog):
         self.canvas.update_grid()
 
         filename = self.filename.get()
-        if not filename:
-            filename = None
+        if filename:
+            task = BackgroundTask(
+                self.app, self.load_wallpaper, self.apply_wallpaper, (filename,)
+            )
+            task.start()
+        else:
+            self.canvas.set_wallpaper(None)
+
+        self.destroy()
 
+    def load_wallpaper(self, filename: str) -> Optional[Tuple[str, Image.Image]]:
+        """
+        Open and decode wallpaper image, ran from a background task.
+        """
         try:
-            self.canvas.set_wallpaper(filename)
-        except FileNotFoundError:
+            image = Image.open(filename)
+            image.load()
+            return filename, image
+        except OSError:
             logging.error("invalid background: %s", filename)
 
-        self.destroy()
+    def apply_wallpaper(self, filename: str = None, image: Image.Image = None):
+        if image is not None:
+            self.canvas.set_wallpaper(filename, image)
+
+    def destroy(self):
+        if self.image_label is not None:
+            self.clear_preview()
+            self.image_label = None
+        super().destroy()
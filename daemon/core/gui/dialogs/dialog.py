@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from core.gui.images import ImageEnum, Images
 from core.gui.themes import DIALOG_PAD
@@ -17,6 +17,7 @@ class Dialog(tk.Toplevel):
         self.withdraw()
         self.app = app
         self.modal = modal
+        self.pending_close = None
         self.title(title)
         self.protocol("WM_DELETE_WINDOW", self.destroy)
         image = Images.get(ImageEnum.CORE, 16)
@@ -36,6 +37,27 @@ class Dialog(tk.Toplevel):
             self.grab_set()
             self.wait_window()
 
+    def close_when_shown(self, callback: Callable = None, *args) -> None:
+        """
+        Destroy dialog and then run callback, waiting until the dialog is visible
+        when it is still being shown, so closing from background task callbacks
+        does not break show().
+        """
+        if self.winfo_exists():
+            if not self.winfo_viewable():
+                self.pending_close = (callback, args)
+                self.bind("<Visibility>", self._close_visible)
+                return
+            self.destroy()
+        if callback:
+            callback(*args)
+
+    def _close_visible(self, event: tk.Event) -> None:
+        if self.pending_close is not None:
+            callback, args = self.pending_close
+            self.pending_close = None
+            self.app.after_idle(self.close_when_shown, callback, *args)
+
     def draw_spacer(self, row: int = None):
         frame = ttk.Frame(self.top)
         frame.grid(row=row, sticky="nsew")
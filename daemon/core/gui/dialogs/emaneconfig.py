@@ -13,7 +13,7 @@ from core.gui.dialogs.dialog import Dialog
 from core.gui.errors import show_grpc_error
 from core.gui.images import ImageEnum, Images
 from core.gui.themes import PADX, PADY
-from core.gui.widgets import ConfigFrame
+from core.gui.widgets import ConfigFrame, configure_columns
 
 if TYPE_CHECKING:
     from core.gui.app import Application
@@ -38,8 +38,7 @@ class GlobalEmaneDialog(Dialog):
     def draw_buttons(self):
         frame = ttk.Frame(self.top)
         frame.grid(sticky="ew")
-        for i in range(2):
-            frame.columnconfigure(i, weight=1)
+        configure_columns(frame, (1, 1))
         button = ttk.Button(frame, text="Apply", command=self.click_apply)
         button.grid(row=0, column=0, sticky="ew", padx=PADX)
 
@@ -88,8 +87,7 @@ class EmaneModelDialog(Dialog):
     def draw_buttons(self):
         frame = ttk.Frame(self.top)
         frame.grid(sticky="ew")
-        for i in range(2):
-            frame.columnconfigure(i, weight=1)
+        configure_columns(frame, (1, 1))
         button = ttk.Button(frame, text="Apply", command=self.click_apply)
         button.grid(row=0, column=0, sticky="ew", padx=PADX)
 
@@ -178,8 +176,7 @@ class EmaneConfigDialog(Dialog):
     def draw_emane_buttons(self):
         frame = ttk.Frame(self.top)
         frame.grid(sticky="ew", pady=PADY)
-        for i in range(2):
-            frame.columnconfigure(i, weight=1)
+        configure_columns(frame, (1, 1))
 
         image = Images.get(ImageEnum.EDITNODE, 16)
         self.emane_model_button = ttk.Button(
@@ -206,8 +203,7 @@ class EmaneConfigDialog(Dialog):
     def draw_apply_and_cancel(self):
         frame = ttk.Frame(self.top)
         frame.grid(sticky="ew")
-        for i in range(2):
-            frame.columnconfigure(i, weight=1)
+        configure_columns(frame, (1, 1))
 
         button = ttk.Button(frame, text="Apply", command=self.click_apply)
         button.grid(row=0, column=0, padx=PADX, sticky="ew")
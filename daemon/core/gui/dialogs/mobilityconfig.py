@@ -2,14 +2,16 @@
 mobility configuration
 """
 from tkinter import ttk
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Optional
 
 import grpc
 
+from core.api.grpc import common_pb2
 from core.gui.dialogs.dialog import Dialog
 from core.gui.errors import show_grpc_error
+from core.gui.task import BackgroundTask
 from core.gui.themes import PADX, PADY
-from core.gui.widgets import ConfigFrame
+from core.gui.widgets import ConfigFrame, configure_columns
 
 if TYPE_CHECKING:
     from core.gui.app import Application
@@ -28,29 +30,46 @@ class MobilityConfigDialog(Dialog):
         )
         self.canvas_node = canvas_node
         self.node = canvas_node.core_node
+        self.config = None
         self.config_frame = None
-        self.has_error = False
+        self.loading = None
+        self.draw()
+        task = BackgroundTask(self.app, self.get_config, self.draw_config)
+        task.start()
+
+    def get_config(self) -> Optional[Dict[str, common_pb2.ConfigOption]]:
+        """
+        Query mobility config, ran from a background task to avoid blocking the
+        dialog
+        """
         try:
-            self.config = self.app.core.get_mobility_config(self.node.id)
-            self.draw()
+            return self.app.core.get_mobility_config(self.node.id)
         except grpc.RpcError as e:
-            self.has_error = True
-            show_grpc_error(e, self.app, self.app)
-            self.destroy()
+            self.app.after(0, self.handle_error, e)
+
+    def handle_error(self, e: grpc.RpcError):
+        self.close_when_shown(show_grpc_error, e, self.app, self.app)
 
     def draw(self):
         self.top.columnconfigure(0, weight=1)
         self.top.rowconfigure(0, weight=1)
+        self.loading = ttk.Label(self.top, text="Loading configuration...")
+        self.loading.grid(row=0, pady=PADY)
+        self.draw_apply_buttons()
+
+    def draw_config(self, config: Dict[str, common_pb2.ConfigOption] = None):
+        if config is None or not self.winfo_exists():
+            return
+        self.config = config
+        self.loading.destroy()
         self.config_frame = ConfigFrame(self.top, self.app, self.config)
         self.config_frame.draw_config()
-        self.config_frame.grid(sticky="nsew", pady=PADY)
-        self.draw_apply_buttons()
+        self.config_frame.grid(row=0, sticky="nsew", pady=PADY)
 
     def draw_apply_buttons(self):
         frame = ttk.Frame(self.top)
-        frame.grid(sticky="ew")
-        for i in range(2):
-            frame.columnconfigure(i, weight=1)
+        frame.grid(row=1, sticky="ew")
+        configure_columns(frame, (1, 1))
 
         button = ttk.Button(frame, text="Apply", command=self.click_apply)
         button.grid(row=0, column=0, padx=PADX, sticky="ew")
@@ -59,6 +78,9 @@ class MobilityConfigDialog(Dialog):
         button.grid(row=0, column=1, sticky="ew")
 
     def click_apply(self):
+        if self.config_frame is None:
+            self.destroy()
+            return
         self.config_frame.parse_config()
         self.app.core.mobility_configs[self.node.id] = self.config
         self.destroy()
@@ -103,10 +103,10 @@ class NodeConfigServiceDialog(Dialog):
                 checked = name in self.current_services
                 self.services.add(name, checked)
 
-    def service_clicked(self, name: str, var: tk.IntVar):
-        if var.get() and name not in self.current_services:
+    def service_clicked(self, name: str, checked: bool):
+        if checked and name not in self.current_services:
             self.current_services.add(name)
-        elif not var.get() and name in self.current_services:
+        elif not checked and name in self.current_services:
             self.current_services.remove(name)
         self.current.listbox.delete(0, tk.END)
         for name in sorted(self.current_services):
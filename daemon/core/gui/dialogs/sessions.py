@@ -1,7 +1,7 @@
 import logging
 import tkinter as tk
 from tkinter import ttk
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Optional
 
 import grpc
 
@@ -15,6 +15,9 @@ from core.gui.themes import PADX, PADY
 if TYPE_CHECKING:
     from core.gui.app import Application
 
+SESSIONS_BATCH = 50
+STATE_NAMES = {x.number: x.name for x in core_pb2.SessionState.Enum.DESCRIPTOR.values}
+
 
 class SessionsDialog(Dialog):
     def __init__(
@@ -25,20 +28,27 @@ class SessionsDialog(Dialog):
         self.selected = False
         self.selected_id = None
         self.tree = None
-        self.has_error = False
-        self.sessions = self.get_sessions()
-        if not self.has_error:
-            self.draw()
+        self.yscrollbar = None
+        self.sessions = []
+        self.loaded = 0
+        self.load_id = None
+        self.draw()
+        task = BackgroundTask(self.app, self.get_sessions, self.draw_sessions)
+        task.start()
 
-    def get_sessions(self) -> Iterable[core_pb2.SessionSummary]:
+    def get_sessions(self) -> Optional[core_pb2.GetSessionsResponse]:
+        """
+        Query sessions, ran from a background task to avoid blocking the dialog
+        """
         try:
-            response = self.app.core.client.get_sessions()
+            response = self.app.core.get_sessions()
             logging.info("sessions: %s", response)
-            return response.sessions
+            return response
         except grpc.RpcError as e:
-            show_grpc_error(e, self.app, self.app)
-            self.has_error = True
-            self.destroy()
+            self.app.after(0, self.handle_error, e)
+
+    def handle_error(self, e: grpc.RpcError):
+        self.close_when_shown(show_grpc_error, e, self.app, self.app)
 
     def draw(self):
         self.top.columnconfigure(0, weight=1)
@@ -76,26 +86,55 @@ class SessionsDialog(Dialog):
         self.tree.heading("state", text="State")
         self.tree.column("nodes", stretch=tk.YES)
         self.tree.heading("nodes", text="Node Count")
-
-        for index, session in enumerate(self.sessions):
-            state_name = core_pb2.SessionState.Enum.Name(session.state)
-            self.tree.insert(
-                "",
-                tk.END,
-                text=str(session.id),
-                values=(session.id, state_name, session.nodes),
-            )
         self.tree.bind("<Double-1>", self.on_selected)
         self.tree.bind("<<TreeviewSelect>>", self.click_select)
 
-        yscrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
-        yscrollbar.grid(row=0, column=1, sticky="ns")
-        self.tree.configure(yscrollcommand=yscrollbar.set)
+        self.yscrollbar = ttk.Scrollbar(
+            frame, orient="vertical", command=self.tree.yview
+        )
+        self.yscrollbar.grid(row=0, column=1, sticky="ns")
+        self.tree.configure(yscrollcommand=self.tree_scrolled)
 
         xscrollbar = ttk.Scrollbar(frame, orient="horizontal", command=self.tree.xview)
         xscrollbar.grid(row=1, sticky="ew")
         self.tree.configure(xscrollcommand=xscrollbar.set)
 
+    def draw_sessions(self, response: core_pb2.GetSessionsResponse = None):
+        if response is None or not self.winfo_exists():
+            return
+        self.sessions = list(response.sessions)
+        self.loaded = 0
+        self.load_sessions()
+
+    def load_sessions(self):
+        """
+        Insert the next batch of sessions, the rest are loaded when scrolled into view
+        """
+        self.load_id = None
+        start = self.loaded
+        self.loaded = min(start + SESSIONS_BATCH, len(self.sessions))
+        rows = [
+            (str(x.id), (x.id, STATE_NAMES[x.state], x.nodes))
+            for x in self.sessions[start : self.loaded]
+        ]
+        for iid, values in rows:
+            self.tree.insert("", tk.END, iid=iid, text=iid, values=values)
+
+    def tree_scrolled(self, first: str, last: str):
+        self.yscrollbar.set(first, last)
+        if (
+            self.load_id is None
+            and float(last) >= 1.0
+            and self.loaded < len(self.sessions)
+        ):
+            self.load_id = self.after_idle(self.load_sessions)
+
+    def destroy(self):
+        if self.load_id is not None:
+            self.after_cancel(self.load_id)
+            self.load_id = None
+        super().destroy()
+
     def draw_buttons(self):
         frame = ttk.Frame(self.top)
         for i in range(5):
@@ -163,10 +202,11 @@ class SessionsDialog(Dialog):
         self.destroy()
 
     def click_select(self, event: tk.Event):
-        item = self.tree.selection()
-        session_id = int(self.tree.item(item, "text"))
+        selection = self.tree.selection()
+        if not selection:
+            return
         self.selected = True
-        self.selected_id = session_id
+        self.selected_id = int(selection[0])
 
     def click_connect(self):
         """
@@ -200,9 +240,10 @@ class SessionsDialog(Dialog):
         self.destroy()
 
     def on_selected(self, event: tk.Event):
-        item = self.tree.selection()
-        sid = int(self.tree.item(item, "text"))
-        self.join_session(sid)
+        selection = self.tree.selection()
+        if not selection:
+            return
+        self.join_session(int(selection[0]))
 
     def shutdown_session(self, sid: int):
         self.app.core.stop_session(sid)
@@ -213,7 +254,7 @@ class SessionsDialog(Dialog):
         logging.debug("Click delete")
         item = self.tree.selection()
         if item:
-            sid = int(self.tree.item(item, "text"))
+            sid = int(item[0])
             self.app.core.delete_session(sid, self.top)
             self.tree.delete(item[0])
             if sid == self.app.core.session_id:
@@ -193,6 +193,7 @@ class ShapeDialog(Dialog):
         data.bold = self.bold.get()
         data.italic = self.italic.get()
         data.underline = self.underline.get()
+        data.invalidate_font()
 
     def save_shape(self):
         """
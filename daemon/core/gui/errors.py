@@ -1,3 +1,4 @@
+import tkinter as tk
 from tkinter import ttk
 from typing import TYPE_CHECKING
 
@@ -11,6 +12,8 @@ from core.gui.widgets import CodeText
 if TYPE_CHECKING:
     from core.gui.app import Application
 
+DETAILS_CHUNK = 65536
+
 
 class ErrorDialog(Dialog):
     def __init__(self, master, app: "Application", title: str, details: str) -> None:
@@ -18,6 +21,7 @@ class ErrorDialog(Dialog):
         self.title = title
         self.details = details
         self.error_message = None
+        self.insert_id = None
         self.draw()
 
     def draw(self) -> None:
@@ -35,13 +39,32 @@ class ErrorDialog(Dialog):
         label.grid(row=0, column=1, sticky="ew")
 
         self.error_message = CodeText(self.top)
-        self.error_message.text.insert("1.0", self.details)
-        self.error_message.text.config(state="disabled")
         self.error_message.grid(sticky="nsew", pady=PADY)
+        self.insert_details()
 
         button = ttk.Button(self.top, text="Close", command=lambda: self.destroy())
         button.grid(sticky="ew")
 
+    def insert_details(self, start: int = 0) -> None:
+        """
+        Insert details a chunk at a time, so large tracebacks do not hold up
+        displaying the dialog.
+        """
+        self.insert_id = None
+        end = start + DETAILS_CHUNK
+        text = self.error_message.text
+        text.config(state=tk.NORMAL)
+        text.insert(tk.END, self.details[start:end])
+        text.config(state=tk.DISABLED)
+        if end < len(self.details):
+            self.insert_id = self.after_idle(self.insert_details, end)
+
+    def destroy(self) -> None:
+        if self.insert_id is not None:
+            self.after_cancel(self.insert_id)
+            self.insert_id = None
+        super().destroy()
+
 
 def show_grpc_error(e: grpc.RpcError, master, app: "Application"):
     title = [x.capitalize() for x in e.code().name.lower().split("_")]
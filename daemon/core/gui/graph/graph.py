@@ -491,6 +491,8 @@ class CanvasGraph(tk.Canvas):
             factor = ZOOM_IN if event.delta > 0 else ZOOM_OUT
         event.x, event.y = self.canvasx(event.x), self.canvasy(event.y)
         self.scale(tk.ALL, event.x, event.y, factor, factor)
+        for shape in self.shapes.values():
+            shape.scale(event.x, event.y, factor)
         self.configure(scrollregion=self.bbox(tk.ALL))
         self.ratio *= float(factor)
         self.offset = (
@@ -781,6 +783,8 @@ class CanvasGraph(tk.Canvas):
         factor = 1 / self.ratio
         self.scale(tk.ALL, self.offset[0], self.offset[1], factor, factor)
         self.move(tk.ALL, -self.offset[0], -self.offset[1])
+        for shape in self.shapes.values():
+            shape.reset_scale()
 
         # reset ratio and offset
         self.ratio = 1.0
@@ -811,8 +815,9 @@ class CanvasGraph(tk.Canvas):
                 logging.warning("tiled background not implemented yet")
 
         # raise items above wallpaper
+        tag_raise = self.tag_raise
         for component in tags.ABOVE_WALLPAPER_TAGS:
-            self.tag_raise(component)
+            tag_raise(component)
 
     def update_grid(self):
         logging.debug("updating grid show grid: %s", self.show_grid.get())
@@ -821,11 +826,12 @@ class CanvasGraph(tk.Canvas):
         else:
             self.itemconfig(tags.GRIDLINE, state=tk.HIDDEN)
 
-    def set_wallpaper(self, filename: str):
+    def set_wallpaper(self, filename: str, image: Image.Image = None):
         logging.debug("setting wallpaper: %s", filename)
         if filename:
-            img = Image.open(filename)
-            self.wallpaper = img
+            if image is None:
+                image = Image.open(filename)
+            self.wallpaper = image
             self.wallpaper_file = filename
             self.redraw_wallpaper()
         else:
@@ -266,8 +266,7 @@ class CanvasNode:
     def show_mobility_config(self):
         self.canvas.context = None
         dialog = MobilityConfigDialog(self.app, self.app, self)
-        if not dialog.has_error:
-            dialog.show()
+        dialog.show()
 
     def show_mobility_player(self):
         self.canvas.context = None
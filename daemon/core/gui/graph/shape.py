@@ -1,5 +1,5 @@
 import logging
-from typing import TYPE_CHECKING, Dict, List, Union
+from typing import TYPE_CHECKING, Dict, Tuple, Union
 
 from core.gui.dialogs.shapemod import ShapeDialog
 from core.gui.graph import tags
@@ -9,8 +9,25 @@ if TYPE_CHECKING:
     from core.gui.app import Application
     from core.gui.graph.graph import CanvasGraph
 
+# canvas create methods for shapes drawn from two corners
+DRAW_METHODS = {ShapeType.OVAL: "create_oval", ShapeType.RECTANGLE: "create_rectangle"}
+
 
 class AnnotationData:
+    __slots__ = (
+        "text",
+        "font",
+        "font_size",
+        "text_color",
+        "fill_color",
+        "border_color",
+        "border_width",
+        "bold",
+        "italic",
+        "underline",
+        "_font_cache",
+    )
+
     def __init__(
         self,
         text: str = "",
@@ -34,9 +51,44 @@ class AnnotationData:
         self.bold = bold
         self.italic = italic
         self.underline = underline
+        self._font_cache = None
+
+    @property
+    def font_spec(self) -> Tuple[Union[int, str], ...]:
+        """
+        Tk font description for the current font settings, built once until
+        invalidated.
+        """
+        if self._font_cache is None:
+            font = [self.font, self.font_size]
+            if self.bold:
+                font.append("bold")
+            if self.italic:
+                font.append("italic")
+            if self.underline:
+                font.append("underline")
+            self._font_cache = tuple(font)
+        return self._font_cache
+
+    def invalidate_font(self):
+        self._font_cache = None
 
 
 class Shape:
+    __slots__ = (
+        "app",
+        "canvas",
+        "shape_type",
+        "id",
+        "text_id",
+        "x1",
+        "y1",
+        "x2",
+        "y2",
+        "created",
+        "shape_data",
+    )
+
     def __init__(
         self,
         app: "Application",
@@ -74,76 +126,57 @@ class Shape:
             dash = None
         else:
             dash = "-"
-        if self.shape_type == ShapeType.OVAL:
-            self.id = self.canvas.create_oval(
-                self.x1,
-                self.y1,
-                self.x2,
-                self.y2,
-                tags=tags.SHAPE,
-                dash=dash,
-                fill=self.shape_data.fill_color,
-                outline=self.shape_data.border_color,
-                width=self.shape_data.border_width,
-            )
-            self.draw_shape_text()
-        elif self.shape_type == ShapeType.RECTANGLE:
-            self.id = self.canvas.create_rectangle(
+        data = self.shape_data
+        draw_method = DRAW_METHODS.get(self.shape_type)
+        if draw_method is not None:
+            self.id = getattr(self.canvas, draw_method)(
                 self.x1,
                 self.y1,
                 self.x2,
                 self.y2,
                 tags=tags.SHAPE,
                 dash=dash,
-                fill=self.shape_data.fill_color,
-                outline=self.shape_data.border_color,
-                width=self.shape_data.border_width,
+                fill=data.fill_color,
+                outline=data.border_color,
+                width=data.border_width,
             )
             self.draw_shape_text()
         elif self.shape_type == ShapeType.TEXT:
-            font = self.get_font()
             self.id = self.canvas.create_text(
                 self.x1,
                 self.y1,
                 tags=tags.SHAPE_TEXT,
-                text=self.shape_data.text,
-                fill=self.shape_data.text_color,
-                font=font,
+                text=data.text,
+                fill=data.text_color,
+                font=data.font_spec,
             )
         else:
             logging.error("unknown shape type: %s", self.shape_type)
         self.created = True
 
-    def get_font(self) -> List[Union[int, str]]:
-        font = [self.shape_data.font, self.shape_data.font_size]
-        if self.shape_data.bold:
-            font.append("bold")
-        if self.shape_data.italic:
-            font.append("italic")
-        if self.shape_data.underline:
-            font.append("underline")
-        return font
-
     def draw_shape_text(self):
-        if self.shape_data.text:
+        data = self.shape_data
+        if data.text:
             x = (self.x1 + self.x2) / 2
-            y = self.y1 + 1.5 * self.shape_data.font_size
-            font = self.get_font()
+            y = self.y1 + 1.5 * data.font_size
             self.text_id = self.canvas.create_text(
                 x,
                 y,
                 tags=tags.SHAPE_TEXT,
-                text=self.shape_data.text,
-                fill=self.shape_data.text_color,
-                font=font,
+                text=data.text,
+                fill=data.text_color,
+                font=data.font_spec,
             )
 
     def shape_motion(self, x1: float, y1: float):
-        self.canvas.coords(self.id, self.x1, self.y1, x1, y1)
+        self.x2 = x1
+        self.y2 = y1
+        self.canvas.coords(self.id, self.x1, self.y1, self.x2, self.y2)
 
     def shape_complete(self, x: float, y: float):
+        tag_raise = self.canvas.tag_raise
         for component in tags.ABOVE_SHAPE:
-            self.canvas.tag_raise(component)
+            tag_raise(component)
         s = ShapeDialog(self.app, self.app, self)
         s.show()
 
@@ -151,34 +184,56 @@ class Shape:
         self.canvas.delete(self.id)
 
     def motion(self, x_offset: float, y_offset: float):
-        original_position = self.canvas.coords(self.id)
-        self.canvas.move(self.id, x_offset, y_offset)
-        coords = self.canvas.coords(self.id)
-        if not self.canvas.valid_position(*coords):
-            self.canvas.coords(self.id, original_position)
+        x1 = self.x1 + x_offset
+        y1 = self.y1 + y_offset
+        x2 = self.x2 + x_offset
+        y2 = self.y2 + y_offset
+        if not self.canvas.valid_position(x1, y1, x2, y2):
             return
-
+        self.x1, self.y1, self.x2, self.y2 = x1, y1, x2, y2
+        self.canvas.move(self.id, x_offset, y_offset)
         self.canvas.move_selection(self.id, x_offset, y_offset)
         if self.text_id is not None:
             self.canvas.move(self.text_id, x_offset, y_offset)
 
+    def scale(self, x: float, y: float, factor: float):
+        """
+        Keep stored coordinates in sync with the canvas scaling all items around
+        the given point.
+        """
+        self.x1 = x + factor * (self.x1 - x)
+        self.y1 = y + factor * (self.y1 - y)
+        self.x2 = x + factor * (self.x2 - x)
+        self.y2 = y + factor * (self.y2 - y)
+
+    def reset_scale(self):
+        """
+        Keep stored coordinates in sync with the canvas resetting its scaling,
+        must be called before the canvas ratio and offset are reset.
+        """
+        self.x1, self.y1 = self.canvas.get_actual_coords(self.x1, self.y1)
+        self.x2, self.y2 = self.canvas.get_actual_coords(self.x2, self.y2)
+
     def delete(self):
         logging.debug("Delete shape, id(%s)", self.id)
-        self.canvas.delete(self.id)
-        self.canvas.delete(self.text_id)
+        if self.text_id is not None:
+            self.canvas.delete(self.id, self.text_id)
+        else:
+            self.canvas.delete(self.id)
 
     def metadata(self) -> Dict[str, Union[str, int, bool]]:
-        coords = self.canvas.coords(self.id)
-        # update coords to actual positions
-        if len(coords) == 4:
-            x1, y1, x2, y2 = coords
-            x1, y1 = self.canvas.get_actual_coords(x1, y1)
-            x2, y2 = self.canvas.get_actual_coords(x2, y2)
-            coords = (x1, y1, x2, y2)
+        # stored coords track the canvas, convert them to actual positions
+        if self.shape_type == ShapeType.TEXT:
+            coords = self.canvas.get_actual_coords(self.x1, self.y1)
         else:
-            x1, y1 = coords
-            x1, y1 = self.canvas.get_actual_coords(x1, y1)
-            coords = (x1, y1)
+            # order corners as the canvas does for rectangles and ovals
+            x1, y1 = self.canvas.get_actual_coords(
+                min(self.x1, self.x2), min(self.y1, self.y2)
+            )
+            x2, y2 = self.canvas.get_actual_coords(
+                max(self.x1, self.x2), max(self.y1, self.y2)
+            )
+            coords = (x1, y1, x2, y2)
         return {
             "type": self.shape_type.value,
             "iconcoords": coords,
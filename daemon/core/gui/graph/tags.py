@@ -11,7 +11,7 @@ WALLPAPER = "wallpaper"
 SELECTION = "selectednodes"
 THROUGHPUT = "throughput"
 MARKER = "marker"
-ABOVE_WALLPAPER_TAGS = [
+ABOVE_WALLPAPER_TAGS = (
     GRIDLINE,
     SHAPE,
     SHAPE_TEXT,
@@ -21,9 +21,9 @@ ABOVE_WALLPAPER_TAGS = [
     ANTENNA,
     NODE,
     NODE_NAME,
-]
-ABOVE_SHAPE = [GRIDLINE, EDGE, LINK_INFO, WIRELESS_EDGE, ANTENNA, NODE, NODE_NAME]
-COMPONENT_TAGS = [
+)
+ABOVE_SHAPE = (GRIDLINE, EDGE, LINK_INFO, WIRELESS_EDGE, ANTENNA, NODE, NODE_NAME)
+COMPONENT_TAGS = (
     EDGE,
     NODE,
     NODE_NAME,
@@ -35,4 +35,4 @@ COMPONENT_TAGS = [
     SHAPE,
     SHAPE_TEXT,
     MARKER,
-]
+)
@@ -1,4 +1,6 @@
+import os
 from enum import Enum
+from functools import lru_cache
 from tkinter import messagebox
 
 from PIL import Image, ImageTk
@@ -7,15 +9,34 @@ from core.api.grpc import core_pb2
 from core.gui.appconfig import LOCAL_ICONS_PATH
 
 
+@lru_cache(maxsize=64)
+def load_image(file_path: str, mtime: float, width: int, height: int) -> Image.Image:
+    """
+    Decode and resize an image, cached by file path, modification time and size, so
+    changed files are decoded again. Does not use tk, so it is safe to call from
+    background threads.
+    """
+    image = Image.open(file_path)
+    # let jpeg decoding scale down large images, keeping enough pixels to resample
+    image.draft(image.mode, (width * 2, height * 2))
+    return image.resize((width, height), Image.LANCZOS)
+
+
 class Images:
     images = {}
+    # decoded images by enum and size, also keeps them referenced for tk
+    enum_images = {}
 
     @classmethod
-    def create(cls, file_path: str, width: int, height: int = None):
+    def load(cls, file_path: str, width: int, height: int = None) -> Image.Image:
         if height is None:
             height = width
-        image = Image.open(file_path)
-        image = image.resize((width, height), Image.ANTIALIAS)
+        mtime = os.path.getmtime(file_path)
+        return load_image(file_path, mtime, width, height)
+
+    @classmethod
+    def create(cls, file_path: str, width: int, height: int = None):
+        image = cls.load(file_path, width, height)
         return ImageTk.PhotoImage(image)
 
     @classmethod
@@ -27,8 +48,15 @@ class Images:
     def get(
         cls, image_enum: Enum, width: int, height: int = None
     ) -> ImageTk.PhotoImage:
-        file_path = cls.images[image_enum.value]
-        return cls.create(file_path, width, height)
+        if height is None:
+            height = width
+        key = (image_enum, width, height)
+        image = cls.enum_images.get(key)
+        if image is None:
+            file_path = cls.images[image_enum.value]
+            image = cls.create(file_path, width, height)
+            cls.enum_images[key] = image
+        return image
 
     @classmethod
     def get_with_image_file(
@@ -1,9 +1,11 @@
 import logging
 import tkinter as tk
+from collections import defaultdict
 from functools import partial
+from operator import attrgetter
 from pathlib import PosixPath
 from tkinter import filedialog, font, ttk
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Sequence
 
 from core.api.grpc import common_pb2, core_pb2
 from core.gui import themes
@@ -13,16 +15,36 @@ if TYPE_CHECKING:
     from core.gui.app import Application
     from core.gui.dialogs.dialog import Dialog
 
-INT_TYPES = {
-    core_pb2.ConfigOptionType.UINT8,
-    core_pb2.ConfigOptionType.UINT16,
-    core_pb2.ConfigOptionType.UINT32,
-    core_pb2.ConfigOptionType.UINT64,
-    core_pb2.ConfigOptionType.INT8,
-    core_pb2.ConfigOptionType.INT16,
-    core_pb2.ConfigOptionType.INT32,
-    core_pb2.ConfigOptionType.INT64,
-}
+INT_TYPES = frozenset(
+    {
+        core_pb2.ConfigOptionType.UINT8,
+        core_pb2.ConfigOptionType.UINT16,
+        core_pb2.ConfigOptionType.UINT32,
+        core_pb2.ConfigOptionType.UINT64,
+        core_pb2.ConfigOptionType.INT8,
+        core_pb2.ConfigOptionType.INT16,
+        core_pb2.ConfigOptionType.INT32,
+        core_pb2.ConfigOptionType.INT64,
+    }
+)
+BOOL_VALUES = ("On", "Off")
+BOOL_MAP = {"1": "On", "0": "Off"}
+IMAGE_FILETYPES = (
+    ("images", "*.gif *.jpg *.png *.bmp *pcx *.tga ..."),
+    ("All Files", "*"),
+)
+
+
+def configure_columns(widget: tk.Widget, weights: Sequence[int]) -> None:
+    """
+    Set grid column weights, configuring all columns sharing a weight in a
+    single grid call.
+    """
+    columns = defaultdict(list)
+    for index, weight in enumerate(weights):
+        columns[weight].append(index)
+    for weight, indexes in columns.items():
+        widget.columnconfigure(indexes, weight=weight)
 
 
 def file_button_click(value: tk.StringVar, parent: tk.Widget):
@@ -52,17 +74,41 @@ class FrameScroll(ttk.Frame):
         self.canvas.configure(
             scrollregion=self.canvas.bbox("all"), yscrollcommand=self.scrollbar.set
         )
+        self.frame_after_id = None
+        self.canvas_after_id = None
+        self.canvas_width = None
         self.frame.bind("<Configure>", self._configure_frame)
         self.canvas.bind("<Configure>", self._configure_canvas)
 
     def _configure_frame(self, event: tk.Event):
+        # coalesce bursts of configure events, such as when adding many rows
+        if self.frame_after_id is None:
+            self.frame_after_id = self.after_idle(self._update_frame)
+
+    def _update_frame(self):
+        self.frame_after_id = None
         req_width = self.frame.winfo_reqwidth()
         if req_width != self.canvas.winfo_reqwidth():
             self.canvas.configure(width=req_width)
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     def _configure_canvas(self, event: tk.Event):
-        self.canvas.itemconfig(self.frame_id, width=event.width)
+        if self.canvas_after_id is None:
+            self.canvas_after_id = self.after_idle(self._update_canvas)
+        self.canvas_width = event.width
+
+    def _update_canvas(self):
+        self.canvas_after_id = None
+        self.canvas.itemconfig(self.frame_id, width=self.canvas_width)
+
+    def destroy(self):
+        if self.frame_after_id is not None:
+            self.after_cancel(self.frame_after_id)
+            self.frame_after_id = None
+        if self.canvas_after_id is not None:
+            self.after_cancel(self.canvas_after_id)
+            self.canvas_after_id = None
+        super().destroy()
 
     def clear(self):
         for widget in self.frame.winfo_children():
@@ -81,33 +127,43 @@ class ConfigFrame(ttk.Notebook):
         self.app = app
         self.config = config
         self.values = {}
+        self.bool_names = set()
 
     def draw_config(self):
-        group_mapping = {}
-        for key in self.config:
-            option = self.config[key]
-            group = group_mapping.setdefault(option.group, [])
-            group.append(option)
+        # validation commands and handlers shared by all entries
+        ip4_command = (self.app.validation.ip4, "%P")
+        int_command = (self.app.validation.positive_int, "%P")
+        float_command = (self.app.validation.positive_float, "%P")
+
+        def focus_out(event: tk.Event):
+            self.app.validation.focus_out(event, "0")
+
+        group_mapping = defaultdict(list)
+        for option in self.config.values():
+            group_mapping[option.group].append(option)
+        option_name = attrgetter("name")
+        for group in group_mapping.values():
+            group.sort(key=option_name)
 
         for group_name in sorted(group_mapping):
             group = group_mapping[group_name]
             tab = FrameScroll(self, self.app, borderwidth=0, padding=FRAME_PAD)
             tab.frame.columnconfigure(1, weight=1)
             self.add(tab, text=group_name)
-            for index, option in enumerate(sorted(group, key=lambda x: x.name)):
+            for index, option in enumerate(group):
                 label = ttk.Label(tab.frame, text=option.label)
                 label.grid(row=index, pady=PADY, padx=PADX, sticky="w")
                 value = tk.StringVar()
                 if option.type == core_pb2.ConfigOptionType.BOOL:
-                    select = ("On", "Off")
                     combobox = ttk.Combobox(
-                        tab.frame, textvariable=value, values=select, state="readonly"
+                        tab.frame,
+                        textvariable=value,
+                        values=BOOL_VALUES,
+                        state="readonly",
                     )
                     combobox.grid(row=index, column=1, sticky="ew")
-                    if option.value == "1":
-                        value.set("On")
-                    else:
-                        value.set("Off")
+                    value.set(BOOL_MAP.get(option.value, "Off"))
+                    self.bool_names.add(option.name)
                 elif option.select:
                     value.set(option.value)
                     select = tuple(option.select)
@@ -132,7 +188,7 @@ class ConfigFrame(ttk.Notebook):
                                 tab.frame,
                                 textvariable=value,
                                 validate="key",
-                                validatecommand=(self.app.validation.ip4, "%P"),
+                                validatecommand=ip4_command,
                             )
                             entry.grid(row=index, column=1, sticky="ew")
                         else:
@@ -145,12 +201,9 @@ class ConfigFrame(ttk.Notebook):
                         tab.frame,
                         textvariable=value,
                         validate="key",
-                        validatecommand=(self.app.validation.positive_int, "%P"),
-                    )
-                    entry.bind(
-                        "<FocusOut>",
-                        lambda event: self.app.validation.focus_out(event, "0"),
+                        validatecommand=int_command,
                     )
+                    entry.bind("<FocusOut>", focus_out)
                     entry.grid(row=index, column=1, sticky="ew")
                 elif option.type == core_pb2.ConfigOptionType.FLOAT:
                     value.set(option.value)
@@ -158,22 +211,17 @@ class ConfigFrame(ttk.Notebook):
                         tab.frame,
                         textvariable=value,
                         validate="key",
-                        validatecommand=(self.app.validation.positive_float, "%P"),
-                    )
-                    entry.bind(
-                        "<FocusOut>",
-                        lambda event: self.app.validation.focus_out(event, "0"),
+                        validatecommand=float_command,
                     )
+                    entry.bind("<FocusOut>", focus_out)
                     entry.grid(row=index, column=1, sticky="ew")
                 else:
                     logging.error("unhandled config option type: %s", option.type)
                 self.values[option.name] = value
 
     def parse_config(self):
-        for key in self.config:
-            option = self.config[key]
-            value = self.values[key]
-            config_value = value.get()
+        for key, option in self.config.items():
+            config_value = self.values[key].get()
             if option.type == core_pb2.ConfigOptionType.BOOL:
                 if config_value == "On":
                     option.value = "1"
@@ -182,18 +230,13 @@ class ConfigFrame(ttk.Notebook):
             else:
                 option.value = config_value
 
-        return {x: self.config[x].value for x in self.config}
+        return {x: option.value for x, option in self.config.items()}
 
     def set_values(self, config: Dict[str, str]) -> None:
         for name, data in config.items():
-            option = self.config[name]
-            value = self.values[name]
-            if option.type == core_pb2.ConfigOptionType.BOOL:
-                if data == "1":
-                    data = "On"
-                else:
-                    data = "Off"
-            value.set(data)
+            if name in self.bool_names:
+                data = BOOL_MAP.get(data, "Off")
+            self.values[name].set(data)
 
 
 class ListboxScroll(ttk.Frame):
@@ -219,8 +262,12 @@ class CheckboxList(FrameScroll):
 
     def add(self, name: str, checked: bool):
         var = tk.BooleanVar(value=checked)
-        func = partial(self.clicked, name, var)
-        checkbox = ttk.Checkbutton(self.frame, text=name, variable=var, command=func)
+        checkbox = ttk.Checkbutton(
+            self.frame,
+            text=name,
+            variable=var,
+            command=lambda: self.clicked(name, var.get()),
+        )
         checkbox.grid(sticky="w")
 
 
@@ -263,11 +310,5 @@ class Spinbox(ttk.Entry):
 
 def image_chooser(parent: "Dialog", path: PosixPath):
     return filedialog.askopenfilename(
-        parent=parent,
-        initialdir=str(path),
-        title="Select",
-        filetypes=(
-            ("images", "*.gif *.jpg *.png *.bmp *pcx *.tga ..."),
-            ("All Files", "*"),
-        ),
+        parent=parent, initialdir=str(path), title="Select", filetypes=IMAGE_FILETYPES
     )
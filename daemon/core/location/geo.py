@@ -3,7 +3,7 @@ Provides conversions from x,y,z to lon,lat,alt.
 """
 
 import logging
-from typing import Tuple
+from typing import List, Tuple
 
 import pyproj
 
@@ -100,16 +100,16 @@ class GeoLocation:
         logging.debug("result x,y,z(%s, %s, %s)", x, y, z)
         return x, y, z
 
-    def getgeo(self, x: float, y: float, z: float) -> Tuple[float, float, float]:
+    def getprojected(self, x: float, y: float, z: float) -> Tuple[float, float, float]:
         """
-        Convert provided x,y,z to lon,lat,alt.
+        Convert provided x,y,z to projected x,y and altitude, relative to the
+        reference point.
 
         :param x: x value
         :param y: y value
         :param z: z value
-        :return: lat,lon,alt representation of provided values
+        :return: projected x,y and altitude of provided values
         """
-        logging.debug("input x,y(%s, %s)", x, y)
         x -= self.refxyz[0]
         y = -(y - self.refxyz[1])
         if z is None:
@@ -118,7 +118,36 @@ class GeoLocation:
             z -= self.refxyz[2]
         px = self.refproj[0] + self.pixels2meters(x)
         py = self.refproj[1] + self.pixels2meters(y)
-        lon, lat = self.to_geo.transform(px, py)
         alt = self.refgeo[2] + self.pixels2meters(z)
+        return px, py, alt
+
+    def getgeo(self, x: float, y: float, z: float) -> Tuple[float, float, float]:
+        """
+        Convert provided x,y,z to lon,lat,alt.
+
+        :param x: x value
+        :param y: y value
+        :param z: z value
+        :return: lat,lon,alt representation of provided values
+        """
+        logging.debug("input x,y(%s, %s)", x, y)
+        px, py, alt = self.getprojected(x, y, z)
+        lon, lat = self.to_geo.transform(px, py)
         logging.debug("result lon,lat,alt(%s, %s, %s)", lon, lat, alt)
         return lat, lon, alt
+
+    def getgeos(
+        self, positions: List[Tuple[float, float, float]]
+    ) -> List[Tuple[float, float, float]]:
+        """
+        Convert provided list of x,y,z positions to lon,lat,alt, using a single
+        projection transform for all positions.
+
+        :param positions: x,y,z positions to convert
+        :return: lat,lon,alt representations of provided positions
+        """
+        if not positions:
+            return []
+        pxs, pys, alts = zip(*[self.getprojected(x, y, z) for x, y, z in positions])
+        lons, lats = self.to_geo.transform(list(pxs), list(pys))
+        return list(zip(lats, lons, alts))
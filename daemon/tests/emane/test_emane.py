@@ -80,6 +80,32 @@ class TestEmane:
         status = ping(node_one, node_two, ip_prefixes, count=5)
         assert not status
 
+    def test_nem_netif_reassigned(self, session, ip_prefixes):
+        """
+        Test looking up interfaces by nem id after nem ids are swapped.
+
+        :param session: session for test
+        :param ip_prefixes: generates ip addresses for nodes
+        """
+        # given
+        emane_network = session.add_node(_type=NodeTypes.EMANE)
+        session.emane.set_model(emane_network, EmaneIeee80211abgModel)
+        for _ in range(2):
+            node = session.add_node()
+            interface = ip_prefixes.create_interface(node)
+            session.add_link(node.id, emane_network.id, interface_one=interface)
+        netif_one, netif_two = emane_network.netifs()
+        emane_network.setnemid(netif_one, 1)
+        emane_network.setnemid(netif_two, 2)
+
+        # when
+        emane_network.setnemid(netif_one, 2)
+        emane_network.setnemid(netif_two, 1)
+
+        # then
+        assert emane_network.getnemnetif(1) is netif_two
+        assert emane_network.getnemnetif(2) is netif_one
+
     def test_xml_emane(self, session, tmpdir, ip_prefixes):
         """
         Test xml client methods for emane.
@@ -37,6 +37,17 @@ class TestConf:
         assert TestConfigurableOptions.name_one in instance_default_values
         assert TestConfigurableOptions.name_two in instance_default_values
 
+    def test_configurable_options_default_copy(self):
+        # given
+        default_values = TestConfigurableOptions.default_values()
+
+        # when
+        default_values[TestConfigurableOptions.name_one] = "changed"
+
+        # then
+        default_values = TestConfigurableOptions.default_values()
+        assert default_values[TestConfigurableOptions.name_one] == ""
+
     def test_nodes(self):
         # given
         config_manager = ConfigurableManager()
@@ -81,6 +92,21 @@ class TestConf:
         assert not config_manager.get_configs(node_id=node_id)
         assert config_manager.get_configs()
 
+    def test_config_reset_node_zero(self):
+        # given
+        config_manager = ConfigurableManager()
+        test_config = {1: 2}
+        node_id = 0
+        config_manager.set_configs(test_config)
+        config_manager.set_configs(test_config, node_id=node_id)
+
+        # when
+        config_manager.config_reset(node_id)
+
+        # then
+        assert not config_manager.get_configs(node_id=node_id)
+        assert config_manager.get_configs()
+
     def test_configs_setget(self):
         # given
         config_manager = ConfigurableManager()
@@ -0,0 +1,30 @@
+import pytest
+
+from core.location.geo import GeoLocation
+
+
+class TestGeo:
+    def test_getgeos(self):
+        # given
+        location = GeoLocation()
+        location.setrefgeo(47.57917, -122.13232, 2.0)
+        location.refscale = 150.0
+        positions = [(0.0, 0.0, None), (100.0, 250.0, 10.0), (-50.0, 75.0, None)]
+
+        # when
+        geos = location.getgeos(positions)
+
+        # then
+        assert len(geos) == len(positions)
+        for (x, y, z), geo in zip(positions, geos):
+            assert geo == pytest.approx(location.getgeo(x, y, z))
+
+    def test_getgeos_empty(self):
+        # given
+        location = GeoLocation()
+
+        # when
+        geos = location.getgeos([])
+
+        # then
+        assert geos == []